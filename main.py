@@ -1,17 +1,25 @@
 import logging
 import requests
+import requests_cache
 import threading
 import tkinter as tk
 import io
 import re
+import sys
+from collections import OrderedDict
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from contextlib import contextmanager
 from tkinter import ttk, messagebox
-from bs4 import BeautifulSoup, Tag
-from typing import List, Optional, Dict
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import Any, Hashable, List, Optional, Dict
 from dataclasses import dataclass
+from datetime import timedelta
 
 # --- Import Image Handling ---
 try:
-    from PIL import Image, ImageTk
+    from PIL import Image, ImageOps, ImageTk
 except ImportError:
     print("CRITICAL ERROR: 'Pillow' library is missing.")
     print("Please install it by running: pip install pillow")
@@ -23,15 +31,16 @@ logger = logging.getLogger(__name__)
 
 # --- Data Models ---
 
-@dataclass
+@dataclass(slots=True)
 class GameItem:
     """Represents a single item within a build."""
     name: str
     image_url: str
     count: int = 1
     image_data: Optional[bytes] = None 
+    icon: Optional[Image.Image] = None  # decoded off the Tk thread
 
-@dataclass
+@dataclass(slots=True)
 class BuildRow:
     """Represents a row of data (items + stats)."""
     items: List[GameItem]
@@ -39,8 +48,16 @@ class BuildRow:
     pick_rate: str
     games: str
 
+@dataclass(slots=True)
+class BuildPage:
+    """A fetched build page: the parsed tree plus the raw body it was parsed from."""
+    tree: html.HtmlElement
+    content: bytes
+
 # --- Helper Functions ---
 
+_NON_LETTERS = re.compile(r'[^a-z]')
+
 def normalize_champion_name(name: str) -> str:
     """
     Normalizes champion names for OP.GG URLs.
@@ -58,13 +75,51 @@ def normalize_champion_name(name: str) -> str:
     clean = name.lower()
     # Remove any character that is NOT a lowercase letter (a-z)
     # This handles spaces, ', ., &, numbers, etc.
-    clean = re.sub(r'[^a-z]', '', clean)
+    clean = _NON_LETTERS.sub('', clean)
     
     # Edge case: Nunu & Willump is often just 'nunu' on some sites, 
     # but op.gg usually accepts 'nunu' or redirects. 
     # 'wukong' is safe (vs MonkeyKing).
     return clean
 
+def decode_icon(data: bytes, size: tuple = (40, 40)) -> Image.Image:
+    """Decodes icon bytes and scales them down to `size`."""
+    pil_img = Image.open(io.BytesIO(data))
+    # thumbnail() drafts JPEGs itself (libjpeg decodes at 1/2, 1/4 or 1/8 scale)
+    # and downsizes in place. LANCZOS is overkill for tiny icons, BILINEAR
+    # looks the same and is much cheaper.
+    pil_img.thumbnail(size, Image.Resampling.BILINEAR)
+    if pil_img.size != size:
+        # Non-square source, keep the aspect ratio and pad to the slot
+        pil_img = ImageOps.pad(pil_img, size, method=Image.Resampling.BILINEAR)
+    return pil_img
+
+class LruCache:
+    """Small thread-safe dict that evicts the least recently used entry past `maxsize`."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+def _text_of(element: html.HtmlElement) -> str:
+    """Joins the stripped text nodes under `element` (like bs4's get_text(strip=True))."""
+    return "".join(part.strip() for part in element.itertext())
+
 # --- Scraper Logic ---
 
 class OpGgAramScraper:
@@ -73,12 +128,68 @@ class OpGgAramScraper:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
         "Accept-Language": "en-US,en;q=0.9"
     }
+    POOL_SIZE = 32
+
+    # Build pages change with patches, CDN icons are effectively immutable
+    CACHE_EXPIRY = {
+        "*.akamaized.net": timedelta(days=30),
+        "op.gg": timedelta(hours=6),
+    }
+
+    # Compiled once; lxml evaluates these in C instead of walking the tree
+    # with Python callbacks the way BeautifulSoup's find() does.
+    _HEADER_TABLE_XPATH = etree.XPath(
+        "(//th[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), $needle)])[1]"
+        "/ancestor::table[1]"
+    )
+    _TABLE_ROWS_XPATH = etree.XPath(".//tbody//tr")
+    _ROW_CELLS_XPATH = etree.XPath("./td")
+    _CELL_IMAGES_XPATH = etree.XPath(".//img[@src != '']")
+    # The count badge sits next to the icon, so only look at the img's siblings
+    _ITEM_COUNT_XPATH = etree.XPath(
+        "../div[contains(concat(' ', normalize-space(@class), ' '), ' absolute ')][1]"
+    )
+    _FIRST_STRONG_XPATH = etree.XPath("(.//strong)[1]")
+    _FIRST_SPAN_XPATH = etree.XPath("(.//span)[1]")
 
     def __init__(self):
-        self.session = requests.Session()
+        # Persist GET responses to a SQLite file in the user cache dir so
+        # relaunching the app doesn't re-download everything.
+        self.session = requests_cache.CachedSession(
+            "opgg_cache",
+            backend="sqlite",
+            use_cache_dir=True,
+            expire_after=timedelta(days=7),
+            urls_expire_after=self.CACHE_EXPIRY,
+            allowable_methods=("GET",),
+        )
         self.session.headers.update(self.BASE_HEADERS)
 
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+        # The default pool only keeps 10 connections, which the image workers
+        # would exhaust and start reconnecting (new TLS handshake) per icon.
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # One long-lived pool, sized so every in-flight download owns a pooled
+        # connection; threads are reused across searches instead of respawned.
+        self._executor = ThreadPoolExecutor(max_workers=self.POOL_SIZE, thread_name_prefix="opgg-fetch")
+        self.closed = False
+
+        # Icons repeat across champions (boots, flash...), keep them for the session
+        self._img_bytes_cache = LruCache(maxsize=512)
+
+    def close(self):
+        """
+        Drops queued downloads so closing the app doesn't wait for them.
+        Downloads already running are still joined at exit (up to their timeout).
+        """
+        self.closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    def fetch_page(self, url: str) -> Optional[BuildPage]:
         try:
             logger.info(f"Requesting: {url}")
             response = self.session.get(url, timeout=10)
@@ -89,99 +200,132 @@ class OpGgAramScraper:
                 return None
                 
             response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
+
+            # Hand lxml the raw bytes with an explicit encoding so neither
+            # requests (response.text) nor lxml has to sniff the charset.
+            # requests falls back to ISO-8859-1 when the header has no charset,
+            # so only trust response.encoding when one was actually declared.
+            declared = "charset=" in response.headers.get("Content-Type", "").lower()
+            encoding = response.encoding if declared and response.encoding else "utf-8"
+            try:
+                tree = self._parse_document(response.content, encoding)
+            except LookupError:
+                # libxml2 doesn't know the declared charset (its names differ
+                # from Python's codecs), OP.GG serves UTF-8 anyway
+                tree = self._parse_document(response.content, "utf-8")
+            return BuildPage(tree=tree, content=response.content)
         except requests.RequestException as e:
             logger.error(f"Failed to fetch data from {url}: {e}")
             return None
 
+    @staticmethod
+    def _parse_document(content: bytes, encoding: str) -> html.HtmlElement:
+        # The build page is always a full document, so skip fromstring()'s
+        # fragment sniffing. React leaves lots of <!-- --> markers and
+        # whitespace-only nodes around; dropping them keeps the tree (and
+        # every XPath walk over it) smaller.
+        parser = html.HTMLParser(encoding=encoding, collect_ids=False, remove_comments=True, remove_blank_text=True)
+        try:
+            return html.document_fromstring(content, parser=parser)
+        except etree.ParserError:
+            # Empty or comment-only body; treat it like an empty document
+            # so the worker reports "Not Found" instead of dying.
+            return html.Element("html")
+
     def fetch_image_bytes(self, url: str) -> Optional[bytes]:
+        cached = self._img_bytes_cache.get(url)
+        if cached is not None:
+            return cached
         try:
-            if url.startswith("//"):
-                url = "https:" + url
-            resp = self.session.get(url, timeout=5)
+            full_url = "https:" + url if url.startswith("//") else url
+            resp = self.session.get(full_url, timeout=5)
             if resp.status_code == 200:
+                self._img_bytes_cache.put(url, resp.content)
                 return resp.content
         except Exception as e:
             logger.warning(f"Could not download image {url}: {e}")
         return None
 
-    def _extract_item_details(self, img_tag: Tag) -> GameItem:
-        name = img_tag.get('alt', 'Unknown Item')
-        src = img_tag.get('src', '')
+    def _extract_item_details(self, img_tag: html.HtmlElement, seen: Dict[tuple, GameItem]) -> GameItem:
+        # The same few dozen items repeat across every build, intern the strings
+        name = sys.intern(img_tag.get('alt', 'Unknown Item'))
+        src = sys.intern(img_tag.get('src', ''))
         count = 1
 
-        parent_div = img_tag.find_parent("div", class_="relative")
-        if parent_div:
-            count_div = parent_div.find("div", class_="absolute")
-            if count_div:
-                try:
-                    count = int(count_div.get_text(strip=True))
-                except ValueError:
-                    count = 1
+        count_div = self._ITEM_COUNT_XPATH(img_tag)
+        if count_div:
+            try:
+                count = int(_text_of(count_div[0]))
+            except ValueError:
+                count = 1
         
-        return GameItem(name=name, image_url=src, count=count)
+        # Identical items share one instance (and so one image download/decode)
+        key = (name, src, count)
+        if key not in seen:
+            seen[key] = GameItem(name=name, image_url=src, count=count)
+        return seen[key]
 
-    def _extract_table_by_header(self, soup: BeautifulSoup, header_text: str) -> List[BuildRow]:
+    def _extract_table_by_header(self, tree: html.HtmlElement, header_text: str, seen: Dict[tuple, GameItem]) -> List[BuildRow]:
         isSummonerSpells = False
         if header_text == "Summoner Spells":
             isSummonerSpells = True
         data = []
         # Case insensitive search for header
-        header = soup.find(lambda tag: tag.name == "th" and header_text.lower() in tag.get_text().lower())
+        table = self._HEADER_TABLE_XPATH(tree, needle=header_text.lower())
         
-        if not header:
+        if not table:
             return []
 
-        table = header.find_parent("table")
+        table = table[0]
 
         if isSummonerSpells:
-            table = table.parent
+            table = table.getparent()
 
-        if not table: return []
-        tbodies = table.find_all("tbody")
-        for tbody in tbodies:
-            if not tbody: return []
-                
-            rows = tbody.find_all("tr")
-
-            for row in rows:
-                cols = row.find_all("td")
-                if not cols or len(cols) < 3:
-                    continue
+        if table is None: return []
+        for row in self._TABLE_ROWS_XPATH(table):
+            cols = self._ROW_CELLS_XPATH(row)
+            if len(cols) < 3:
+                continue
 
-                item_container = cols[0]
-                images = item_container.find_all("img")
-                items_list = [self._extract_item_details(img) for img in images if img.get('src')]
+            images = self._CELL_IMAGES_XPATH(cols[0])
+            items_list = [self._extract_item_details(img, seen) for img in images]
 
-                stats_div = cols[1]
-                pick_rate = stats_div.find("strong").get_text(strip=True) if stats_div.find("strong") else "N/A"
-                games = stats_div.find("span").get_text(strip=True) if stats_div.find("span") else "N/A"
+            stats_strong = self._FIRST_STRONG_XPATH(cols[1])
+            stats_span = self._FIRST_SPAN_XPATH(cols[1])
+            pick_rate = _text_of(stats_strong[0]) if stats_strong else "N/A"
+            games = _text_of(stats_span[0]) if stats_span else "N/A"
 
-                win_rate_div = cols[2]
-                win_rate = win_rate_div.find("strong").get_text(strip=True) if win_rate_div.find("strong") else "N/A"
+            win_rate_strong = self._FIRST_STRONG_XPATH(cols[2])
+            win_rate = _text_of(win_rate_strong[0]) if win_rate_strong else "N/A"
 
-                data.append(BuildRow(items=items_list, win_rate=win_rate, pick_rate=pick_rate, games=games))
+            data.append(BuildRow(items=items_list, win_rate=win_rate, pick_rate=pick_rate, games=games))
         
         # sort 
         data.sort(key=lambda x: x.win_rate, reverse=True)
 
         return data
 
-    def get_all_data(self, soup: BeautifulSoup) -> Dict[str, List[BuildRow]]:
+    def get_all_data(self, tree: html.HtmlElement) -> Dict[str, List[BuildRow]]:
+        seen: Dict[tuple, GameItem] = {}
         results = {
-            "Core Builds": self._extract_table_by_header(soup, "Core Builds"),
-            "Starter Items": self._extract_table_by_header(soup, "Starter Items"),
-            "Boots": self._extract_table_by_header(soup, "Boots"),
-            "Summoner Spells": self._extract_table_by_header(soup, "Summoner Spells")
+            "Core Builds": self._extract_table_by_header(tree, "Core Builds", seen),
+            "Starter Items": self._extract_table_by_header(tree, "Starter Items", seen),
+            "Boots": self._extract_table_by_header(tree, "Boots", seen),
+            "Summoner Spells": self._extract_table_by_header(tree, "Summoner Spells", seen)
         }
-        
-        # Pre-fetch images
-        all_rows = [row for cat in results.values() for row in cat]
-        for row in all_rows:
+        return results
+
+    def load_images(self, rows: List[BuildRow]):
+        """Downloads the icons for `rows` (each unique URL once, in parallel)."""
+        if self.closed:
+            return
+        unique_urls = list({item.image_url for row in rows for item in row.items if item.image_url})
+        images = dict(zip(unique_urls, self._executor.map(self.fetch_image_bytes, unique_urls)))
+
+        for row in rows:
             for item in row.items:
                 if item.image_url:
-                    item.image_data = self.fetch_image_bytes(item.image_url)
-        return results
+                    item.image_data = images[item.image_url]
 
 # --- GUI Components ---
 
@@ -202,6 +346,9 @@ class ScrollableFrame(ttk.Frame):
         self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
 class AramBuildApp:
+    ICON_SIZE = (40, 40)
+    NOTEBOOK_PACK = dict(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("OP.GG ARAM Lite")
@@ -209,9 +356,24 @@ class AramBuildApp:
         
         self.scraper = OpGgAramScraper()
         self.photo_refs = [] 
+        # Decoded icons by (url, width, height); survives between searches
+        self._photo_cache = LruCache(maxsize=512)
+        # Widgets kept per tab and recycled between searches
+        self._headers: Dict[str, ttk.Frame] = {}
+        self._empty_labels: Dict[str, ttk.Label] = {}
+        self._row_widgets: Dict[str, List[dict]] = {}
+        # Current search; icons are only loaded for tabs that get shown
+        self._search_id = 0
+        self._results: Dict[str, List[BuildRow]] = {}
+        self._loaded_tabs = set()
         
         self._setup_styles()
         self._build_layout()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        self.scraper.close()
+        self.root.destroy()
 
     def _setup_styles(self):
         style = ttk.Style()
@@ -239,13 +401,14 @@ class AramBuildApp:
 
         # 2. Main Tab Area
         self.notebook = ttk.Notebook(self.root)
-        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.notebook.pack(**self.NOTEBOOK_PACK)
 
         self.tabs = {}
         for category in ["Starter Items", "Core Builds", "Boots", "Summoner Spells"]:
             frame = ScrollableFrame(self.notebook)
             self.notebook.add(frame, text=category)
             self.tabs[category] = frame.scrollable_frame
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self._load_tab_images(self._current_tab()))
 
     def on_fetch_click(self):
         raw_name = self.champ_var.get().strip()
@@ -261,30 +424,79 @@ class AramBuildApp:
         self.fetch_btn.config(state=tk.DISABLED)
         self.status_lbl.config(text=f"Searching for '{clean_name}'...", foreground="blue")
         
-        # Clear UI
+        # Clear UI (rows are only hidden, _update_ui refills them)
+        self._search_id += 1
+        self._results = {}
+        self._loaded_tabs.clear()
         self.photo_refs.clear()
-        for frame in self.tabs.values():
-            for widget in frame.winfo_children():
-                widget.destroy()
+        for category in self.tabs:
+            for widgets in self._row_widgets.get(category, []):
+                widgets["frame"].pack_forget()
+            self._get_empty_label(category).pack_forget()
 
         # Start thread
-        threading.Thread(target=self._worker_thread, args=(url,), daemon=True).start()
+        threading.Thread(target=self._worker_thread, args=(url, self._search_id), daemon=True).start()
 
-    def _worker_thread(self, url: str):
-        soup = self.scraper.fetch_page(url)
+    def _worker_thread(self, url: str, search_id: int):
+        page = self.scraper.fetch_page(url)
         
-        if not soup:
+        if page is None:
             self.root.after(0, self._handle_error)
             return
             
         # Check if we actually landed on a build page (basic validation)
         # Often if the champ doesn't exist, OP.GG might redirect to home or show 404
-        if "Core Builds" not in soup.text and "Starter Items" not in soup.text:
+        # Plain substring search on the raw body, no need to walk the parsed tree
+        if b"Core Builds" not in page.content and b"Starter Items" not in page.content:
              self.root.after(0, self._handle_not_found)
              return
 
-        results = self.scraper.get_all_data(soup)
-        self.root.after(0, lambda: self._update_ui(results))
+        results = self.scraper.get_all_data(page.tree)
+        self.root.after(0, lambda: self._update_ui(results, search_id))
+
+    def _current_tab(self) -> str:
+        return self.notebook.tab(self.notebook.select(), "text")
+
+    def _load_tab_images(self, category: str):
+        """Fetches the icons of one tab in the background, once per search."""
+        # Nothing to load for tabs without rows (they have no row widgets either)
+        if not self._results.get(category) or category in self._loaded_tabs:
+            return
+        self._loaded_tabs.add(category)
+        rows = self._results[category]
+        threading.Thread(target=self._tab_images_worker, args=(category, rows, self._search_id), daemon=True).start()
+
+    def _tab_images_worker(self, category: str, rows: List[BuildRow], search_id: int):
+        try:
+            self.scraper.load_images(rows)
+        except (CancelledError, RuntimeError):
+            return  # the window was closed and the executor shut down mid-load
+        if self.scraper.closed:
+            return
+        self._decode_icons(rows)
+        self.root.after(0, lambda: self._show_tab_images(category, rows, search_id))
+
+    def _show_tab_images(self, category: str, rows: List[BuildRow], search_id: int):
+        if search_id != self._search_id:
+            return  # a newer search replaced these rows
+        for widgets, row_data in zip(self._row_widgets.get(category, []), rows):
+            for slot, item in zip(widgets["slots"], row_data.items):
+                self._fill_item_slot(slot, item)
+
+    def _decode_icons(self, rows: List[BuildRow]):
+        """Decodes icons in the worker so the Tk thread only has to wrap them in PhotoImages."""
+        decoded = {}
+        for row in rows:
+            for item in row.items:
+                if not item.image_data or self._photo_cache.get((item.image_url, *self.ICON_SIZE)) is not None:
+                    continue
+                if item.image_url not in decoded:
+                    try:
+                        decoded[item.image_url] = decode_icon(item.image_data, self.ICON_SIZE)
+                    except Exception as e:
+                        logger.warning(f"Could not decode image {item.image_url}: {e}")
+                        decoded[item.image_url] = None
+                item.icon = decoded[item.image_url]
 
     def _handle_error(self):
         self.status_lbl.config(text="Connection Error", foreground="red")
@@ -296,59 +508,142 @@ class AramBuildApp:
         messagebox.showwarning("Not Found", "Could not find ARAM data for this champion.\nCheck the spelling.")
         self.fetch_btn.config(state=tk.NORMAL)
 
-    def _update_ui(self, results: Dict[str, List[BuildRow]]):
+    @contextmanager
+    def _layout_frozen(self):
+        """Hides the notebook while its widgets change so Tk lays it out once at the end."""
+        self.notebook.pack_forget()
+        try:
+            yield
+        finally:
+            self.notebook.pack(**self.NOTEBOOK_PACK)
+            self.root.update_idletasks()
+
+    def _update_ui(self, results: Dict[str, List[BuildRow]], search_id: int):
+        # Enter still triggers a search while one is running; only the newest may render
+        if search_id != self._search_id:
+            return
+
+        with self._layout_frozen():
+            self._render_results(results)
+
+        self.status_lbl.config(text="Success", foreground="green")
+        self.fetch_btn.config(state=tk.NORMAL)
+
+        # Text is up, now fetch icons for the tab the user is looking at
+        self._results = results
+        self._loaded_tabs = set()
+        self._load_tab_images(self._current_tab())
+
+    def _render_results(self, results: Dict[str, List[BuildRow]]):
         for category, rows in results.items():
             parent_frame = self.tabs[category]
             
             # Header
-            header_frame = ttk.Frame(parent_frame, style="Header.TLabel", padding=5)
-            header_frame.pack(fill=tk.X, pady=(0, 5))
-            
-            ttk.Label(header_frame, text="Win Rate", width=10, style="Header.TLabel").grid(row=0, column=0, padx=5)
-            ttk.Label(header_frame, text="Pick Rate", width=10, style="Header.TLabel").grid(row=0, column=1, padx=5)
-            ttk.Label(header_frame, text="Games", width=10, style="Header.TLabel").grid(row=0, column=2, padx=5)
-            ttk.Label(header_frame, text="Items", style="Header.TLabel").grid(row=0, column=3, padx=20, sticky="w")
+            if category not in self._headers:
+                self._headers[category] = self._build_header(parent_frame)
 
+            self._set_packed(self._get_empty_label(category), not rows, pady=10)
             if not rows:
-                ttk.Label(parent_frame, text="No data found.").pack(pady=10)
                 continue
 
+            # Reuse the widgets from the previous search, only create what's missing
+            row_widgets = self._row_widgets.setdefault(category, [])
             for i, row_data in enumerate(rows):
-                row_frame = ttk.Frame(parent_frame)
-                row_frame.pack(fill=tk.X, pady=5, padx=5)
-                bg_color = "#f3f4f6" if i % 2 == 0 else "white"
-                
-                # Stats
-                tk.Label(row_frame, text=row_data.win_rate, width=12, bg=bg_color, font=('Segoe UI', 10, 'bold'), fg="blue").grid(row=0, column=0, padx=5, ipady=10)
-                tk.Label(row_frame, text=row_data.pick_rate, width=12, bg=bg_color, font=('Segoe UI', 10)).grid(row=0, column=1, padx=5, ipady=10)
-                tk.Label(row_frame, text=row_data.games, width=12, bg=bg_color, font=('Segoe UI', 10), fg="gray").grid(row=0, column=2, padx=5, ipady=10)
-
-                # Items
-                items_frame = tk.Frame(row_frame, bg=bg_color)
-                items_frame.grid(row=0, column=3, padx=20, sticky="w")
-
-                for item in row_data.items:
-                    item_wrapper = tk.Frame(items_frame, bg=bg_color)
-                    item_wrapper.pack(side=tk.LEFT, padx=4)
-
-                    if item.image_data:
-                        try:
-                            pil_img = Image.open(io.BytesIO(item.image_data))
-                            pil_img = pil_img.resize((40, 40), Image.Resampling.LANCZOS)
-                            tk_img = ImageTk.PhotoImage(pil_img)
-                            self.photo_refs.append(tk_img)
-                            
-                            tk.Label(item_wrapper, image=tk_img, bg=bg_color).pack()
-                            if item.count > 1:
-                                count_lbl = tk.Label(item_wrapper, text=f"x{item.count}", bg="black", fg="white", font=("Arial", 8, "bold"))
-                                count_lbl.place(relx=1.0, rely=1.0, anchor="se")
-                        except Exception:
-                            tk.Label(item_wrapper, text="?", bg=bg_color).pack()
-                    else:
-                        tk.Label(item_wrapper, text=item.name[:5], bg=bg_color).pack()
+                if i == len(row_widgets):
+                    row_widgets.append(self._build_row(parent_frame, i))
+                self._fill_row(row_widgets[i], row_data)
 
-        self.status_lbl.config(text="Success", foreground="green")
-        self.fetch_btn.config(state=tk.NORMAL)
+    def _build_header(self, parent_frame: ttk.Frame) -> ttk.Frame:
+        header_frame = ttk.Frame(parent_frame, style="Header.TLabel", padding=5)
+        header_frame.pack(fill=tk.X, pady=(0, 5))
+        
+        ttk.Label(header_frame, text="Win Rate", width=10, style="Header.TLabel").grid(row=0, column=0, padx=5)
+        ttk.Label(header_frame, text="Pick Rate", width=10, style="Header.TLabel").grid(row=0, column=1, padx=5)
+        ttk.Label(header_frame, text="Games", width=10, style="Header.TLabel").grid(row=0, column=2, padx=5)
+        ttk.Label(header_frame, text="Items", style="Header.TLabel").grid(row=0, column=3, padx=20, sticky="w")
+        return header_frame
+
+    def _get_empty_label(self, category: str) -> ttk.Label:
+        if category not in self._empty_labels:
+            self._empty_labels[category] = ttk.Label(self.tabs[category], text="No data found.")
+        return self._empty_labels[category]
+
+    def _build_row(self, parent_frame: ttk.Frame, index: int) -> dict:
+        bg_color = "#f3f4f6" if index % 2 == 0 else "white"
+        row_frame = ttk.Frame(parent_frame)
+
+        # Stats
+        win_lbl = tk.Label(row_frame, width=12, bg=bg_color, font=('Segoe UI', 10, 'bold'), fg="blue")
+        win_lbl.grid(row=0, column=0, padx=5, ipady=10)
+        pick_lbl = tk.Label(row_frame, width=12, bg=bg_color, font=('Segoe UI', 10))
+        pick_lbl.grid(row=0, column=1, padx=5, ipady=10)
+        games_lbl = tk.Label(row_frame, width=12, bg=bg_color, font=('Segoe UI', 10), fg="gray")
+        games_lbl.grid(row=0, column=2, padx=5, ipady=10)
+
+        # Items
+        items_frame = tk.Frame(row_frame, bg=bg_color)
+        items_frame.grid(row=0, column=3, padx=20, sticky="w")
+
+        return {"frame": row_frame, "bg": bg_color, "win_rate": win_lbl, "pick_rate": pick_lbl,
+                "games": games_lbl, "items_frame": items_frame, "slots": []}
+
+    def _build_item_slot(self, items_frame: tk.Frame, bg_color: str) -> dict:
+        item_wrapper = tk.Frame(items_frame, bg=bg_color)
+        icon_lbl = tk.Label(item_wrapper, bg=bg_color)
+        icon_lbl.pack()
+        count_lbl = tk.Label(item_wrapper, bg="black", fg="white", font=("Arial", 8, "bold"))
+        return {"wrapper": item_wrapper, "icon": icon_lbl, "count": count_lbl}
+
+    def _fill_row(self, widgets: dict, row_data: BuildRow):
+        widgets["frame"].pack(fill=tk.X, pady=5, padx=5)
+        widgets["win_rate"].config(text=row_data.win_rate)
+        widgets["pick_rate"].config(text=row_data.pick_rate)
+        widgets["games"].config(text=row_data.games)
+
+        slots = widgets["slots"]
+        for j, item in enumerate(row_data.items):
+            if j == len(slots):
+                slots.append(self._build_item_slot(widgets["items_frame"], widgets["bg"]))
+            slots[j]["wrapper"].pack(side=tk.LEFT, padx=4)
+            self._fill_item_slot(slots[j], item)
+
+        # Hide slots left over from a longer build
+        for slot in slots[len(row_data.items):]:
+            slot["wrapper"].pack_forget()
+
+    def _fill_item_slot(self, slot: dict, item: GameItem):
+        icon_lbl, count_lbl = slot["icon"], slot["count"]
+        count_lbl.place_forget()
+
+        # Icons seen in an earlier search show up right away, before the tab's download
+        cache_key = (item.image_url, *self.ICON_SIZE)
+        if not item.image_data and self._photo_cache.get(cache_key) is None:
+            icon_lbl.config(image="", text=item.name[:5])
+            return
+
+        try:
+            tk_img = self._photo_cache.get(cache_key)
+            if tk_img is None:
+                # The worker normally decoded it; fall back if the cache evicted it meanwhile
+                pil_img = item.icon or decode_icon(item.image_data, self.ICON_SIZE)
+                tk_img = ImageTk.PhotoImage(pil_img)
+                self._photo_cache.put(cache_key, tk_img)
+            # Anchor it for the current view even if the cache evicts it
+            self.photo_refs.append(tk_img)
+
+            icon_lbl.config(image=tk_img, text="")
+            if item.count > 1:
+                count_lbl.config(text=f"x{item.count}")
+                count_lbl.place(relx=1.0, rely=1.0, anchor="se")
+        except Exception:
+            icon_lbl.config(image="", text="?")
+
+    @staticmethod
+    def _set_packed(widget: tk.Widget, visible: bool, **pack_options):
+        if visible:
+            widget.pack(**pack_options)
+        else:
+            widget.pack_forget()
 
 
 if __name__ == "__main__":